@@ -2,59 +2,258 @@
 Document Object Model for vCard
 """
 
-from typing import Dict, List, Optional
+import re
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# Property and parameter names are case-insensitive (RFC 6350 Section 3.3).
+# Names come from a small vocabulary, so their canonical uppercase forms are
+# cached and interned; dictionary lookups on interned keys hit by identity.
+_RFC6350_NAMES = (
+    # Properties (RFC 6350 Section 6)
+    "BEGIN", "END", "SOURCE", "KIND", "XML", "FN", "N", "NICKNAME", "PHOTO",
+    "BDAY", "ANNIVERSARY", "GENDER", "ADR", "TEL", "EMAIL", "IMPP", "LANG",
+    "TZ", "GEO", "TITLE", "ROLE", "LOGO", "ORG", "MEMBER", "RELATED",
+    "CATEGORIES", "NOTE", "PRODID", "REV", "SOUND", "UID", "CLIENTPIDMAP",
+    "URL", "VERSION", "KEY", "FBURL", "CALADRURI", "CALURI",
+    # Parameters (RFC 6350 Section 5)
+    "LANGUAGE", "VALUE", "PREF", "ALTID", "PID", "TYPE", "MEDIATYPE",
+    "CALSCALE", "SORT-AS", "LABEL",
+)
+
+_CANONICAL_NAMES: Dict[str, str] = {
+    spelling: sys.intern(name)
+    for name in _RFC6350_NAMES
+    for spelling in (name, name.lower())
+}
+_CANONICAL_NAMES_LIMIT = 4096
+
+# Enumerated parameter values recur on almost every property of an address
+# book, so parsed and added values share one interned copy of each.
+_PARAMETER_VALUES: Dict[str, str] = {
+    value: sys.intern(value)
+    for value in (
+        # TYPE (RFC 6350 Sections 5.6, 6.4.1 and 6.6.6), plus the vCard 3.0
+        # EMAIL and ADR types offered by the builder
+        "work", "home", "text", "voice", "fax", "cell", "video", "pager",
+        "textphone", "internet", "postal", "parcel", "dom", "intl",
+        "contact", "acquaintance", "friend", "met", "co-worker", "colleague",
+        "co-resident", "neighbor", "child", "parent", "sibling", "spouse",
+        "kin", "muse", "crush", "date", "sweetheart", "me", "agent",
+        "emergency",
+        # VALUE (RFC 6350 Section 5.2)
+        "uri", "time", "date-time", "date-and-or-time", "timestamp",
+        "boolean", "integer", "float", "utc-offset", "language-tag",
+        # CALSCALE (RFC 6350 Section 5.8)
+        "gregorian",
+    ) + tuple(str(pref) for pref in range(1, 101))  # PREF (Section 5.3)
+}
+
+
+def _canon_type(value: str) -> str:
+    """Return the canonical (lowercase, interned) form of a TYPE value"""
+    canonical = _PARAMETER_VALUES.get(value)
+    if canonical is None:
+        value = value.lower()
+        canonical = _PARAMETER_VALUES.get(value, value)
+    return canonical
+
+
+def _canon(name: str) -> str:
+    """Return the canonical (uppercase, interned) form of a name"""
+    canonical = _CANONICAL_NAMES.get(name)
+    if canonical is None:
+        canonical = sys.intern(name.upper())
+        if len(_CANONICAL_NAMES) < _CANONICAL_NAMES_LIMIT:
+            _CANONICAL_NAMES[name] = canonical
+    return canonical
+
+
+# Match one name=value parameter and its separator, or split value lists on
+# unquoted ','. An unterminated quote runs to the end of the input.
+_PARAMETER_RE = re.compile(r'([^;="]*)(=?)((?:"[^"]*(?:"|\Z)|[^;"])*)(?:;|\Z)')
+_PARAMETER_VALUE_RE = re.compile(r'((?:"[^"]*(?:"|\Z)|[^,"])*)(?:,|\Z)')
+
+
+def _iter_parameters(params_part: str) -> Iterator[Tuple[str, str]]:
+    """Yield the name and raw value of each parameter in one pass"""
+    end = len(params_part)
+    for match in _PARAMETER_RE.finditer(params_part):
+        param_name, equals, param_value = match.groups()
+        if not equals:
+            # The empty match at end of input is not a parameter
+            if match.start() == end:
+                return
+            raise ValueError(f"Invalid parameter (missing equals): {param_name}{param_value}")
+        yield param_name, param_value
+
+
+def _split_parameter_values(param_value: str) -> List[str]:
+    """Split parameter values by comma, respecting quotes"""
+    if '"' not in param_value:
+        values = param_value.split(',')
+        if not values[-1]:
+            values.pop()
+        return values
+
+    values = [value.replace('"', '') for value in _PARAMETER_VALUE_RE.findall(param_value)]
+    values.pop()
+    # A trailing value made up only of quotes is dropped, like an empty one
+    if param_value.endswith('"') and not values[-1]:
+        values.pop()
+    return values
+
+
+def _parse_parameters(params_part: str) -> Dict[str, List[str]]:
+    """Decode the raw parameter text of a property line"""
+    parameters: Dict[str, List[str]] = {}
+
+    for param_name, param_value in _iter_parameters(params_part):
+        param_name = _canon(param_name)
+
+        # Remove quotes if present
+        if param_value.startswith('"') and param_value.endswith('"') and len(param_value) >= 2:
+            param_value = param_value[1:-1]
+
+        # Handle comma-separated values
+        # TYPE values are case-insensitive and stored lowercase
+        if param_name == "TYPE":
+            values = [_canon_type(value) for value in _split_parameter_values(param_value)]
+        else:
+            values = [_PARAMETER_VALUES.get(value, value) for value in _split_parameter_values(param_value)]
+        if values:
+            if param_name in parameters:
+                parameters[param_name].extend(values)
+            else:
+                parameters[param_name] = values
+
+    return parameters
+
+
 class VCardProperty:
     """Represents a vCard property with parameters and value"""
 
+    __slots__ = ('name', 'value', '_params_raw', '_parameters')
+
     def __init__(self, name: str, value: str):
-        self.name = name.upper()
+        self.name = _canon(name)
         self.value = value
-        self.parameters: Dict[str, List[str]] = {}
+        # Parsed properties keep their raw parameter text, which stays the
+        # source of truth until the parameters may have been modified;
+        # _parameters caches the decoded form once it is first needed
+        self._params_raw: Optional[str] = None
+        self._parameters: Optional[Dict[str, List[str]]] = {}
+
+    @classmethod
+    def _from_parsed(cls, name: str, value: str, params_raw: Optional[str]) -> 'VCardProperty':
+        """Create a property from parser output; name must already be canonical"""
+        prop = cls.__new__(cls)
+        prop.name = name
+        prop.value = value
+        prop._params_raw = params_raw or None
+        prop._parameters = None if params_raw else {}
+        return prop
+
+    def _decoded_parameters(self) -> Dict[str, List[str]]:
+        """Decode the parameters if needed, keeping the raw text"""
+        parameters = self._parameters
+        if parameters is None:
+            parameters = self._parameters = _parse_parameters(self._params_raw)
+        return parameters
+
+    @property
+    def parameters(self) -> Dict[str, List[str]]:
+        """Parameters of this property, keyed by uppercase name"""
+        parameters = self._decoded_parameters()
+        # The caller may modify the dict, so it replaces the raw text
+        self._params_raw = None
+        return parameters
+
+    @parameters.setter
+    def parameters(self, parameters: Dict[str, List[str]]):
+        types = parameters.get("TYPE")
+        if types:
+            parameters["TYPE"] = [_canon_type(value) for value in types]
+        self._params_raw = None
+        self._parameters = parameters
 
     def add_parameter(self, param_name: str, param_value: str):
         """Add a parameter to this property"""
-        param_name = param_name.upper()
-        if param_name not in self.parameters:
-            self.parameters[param_name] = []
-        self.parameters[param_name].append(param_value)
+        param_name = _canon(param_name)
+        parameters = self.parameters
+        if param_name not in parameters:
+            parameters[param_name] = []
+        if param_name == "TYPE":
+            param_value = _canon_type(param_value)
+        else:
+            param_value = _PARAMETER_VALUES.get(param_value, param_value)
+        parameters[param_name].append(param_value)
 
     def get_parameter(self, param_name: str) -> Optional[str]:
         """Get the first value of a parameter"""
-        param_name = param_name.upper()
-        values = self.parameters.get(param_name, [])
+        param_name = _canon(param_name)
+        values = self._decoded_parameters().get(param_name, [])
         return values[0] if values else None
 
     def get_parameters(self, param_name: str) -> List[str]:
         """Get all values of a parameter"""
-        param_name = param_name.upper()
-        return self.parameters.get(param_name, [])
+        param_name = _canon(param_name)
+        values = self._decoded_parameters().get(param_name, [])
+        # While the raw text is what gets serialized, hand out a copy so an
+        # edit to the list cannot make the DOM and the output disagree
+        if self._params_raw is not None:
+            return list(values)
+        return values
 
 
 class VCardComponent:
     """Base class for vCard components"""
 
+    __slots__ = ('_props', '_by_name')
+
     def __init__(self):
-        self.properties: Dict[str, List[VCardProperty]] = {}
+        # Properties in document order, plus an index of them by name
+        self._props: List[VCardProperty] = []
+        self._by_name: Dict[str, List[VCardProperty]] = {}
+
+    @property
+    def properties(self) -> Tuple[VCardProperty, ...]:
+        """All properties of this component in insertion order, read-only"""
+        # A tuple, so properties can only be added through add_property,
+        # which also keeps the name index up to date
+        return tuple(self._props)
 
     def add_property(self, prop: VCardProperty):
         """Add a property to this component"""
-        if prop.name not in self.properties:
-            self.properties[prop.name] = []
-        self.properties[prop.name].append(prop)
+        self._props.append(prop)
+        props = self._by_name.get(prop.name)
+        if props is None:
+            self._by_name[prop.name] = [prop]
+        else:
+            props.append(prop)
+
+    def _extend_properties(self, props: List[VCardProperty]):
+        """Add several properties at once, in order"""
+        self._props.extend(props)
+        by_name = self._by_name
+        for prop in props:
+            named = by_name.get(prop.name)
+            if named is None:
+                by_name[prop.name] = [prop]
+            else:
+                named.append(prop)
 
     def get_property(self, name: str) -> Optional[VCardProperty]:
         """Get the first property with the given name"""
-        name = name.upper()
-        props = self.properties.get(name, [])
+        props = self._by_name.get(_canon(name))
         return props[0] if props else None
 
     def get_properties(self, name: str) -> List[VCardProperty]:
-        """Get all properties with the given name"""
-        name = name.upper()
-        return self.properties.get(name, [])
+        """Get all properties with the given name, as a new list"""
+        props = self._by_name.get(_canon(name))
+        return list(props) if props else []
 
     @property
     def component_type(self) -> str:
@@ -65,6 +264,8 @@ class VCardComponent:
 class VCardObject(VCardComponent):
     """Root vCard object (VCARD)"""
 
+    __slots__ = ()
+
     @property
     def component_type(self) -> str:
         return "VCARD"
@@ -236,14 +437,8 @@ class StructuredName:
     @staticmethod
     def parse(value: str) -> 'StructuredName':
         """Parse a structured name from a semicolon-separated string"""
-        parts = value.split(';')
-        return StructuredName(
-            family_name=parts[0] if len(parts) > 0 else "",
-            given_name=parts[1] if len(parts) > 1 else "",
-            additional_names=parts[2] if len(parts) > 2 else "",
-            honorific_prefixes=parts[3] if len(parts) > 3 else "",
-            honorific_suffixes=parts[4] if len(parts) > 4 else "",
-        )
+        parts = (value.split(';') + [""] * 5)[:5]
+        return StructuredName(*parts)
 
     def __str__(self) -> str:
         return f"{self.family_name};{self.given_name};{self.additional_names};{self.honorific_prefixes};{self.honorific_suffixes}"
@@ -263,16 +458,8 @@ class StructuredAddress:
     @staticmethod
     def parse(value: str) -> 'StructuredAddress':
         """Parse a structured address from a semicolon-separated string"""
-        parts = value.split(';')
-        return StructuredAddress(
-            post_office_box=parts[0] if len(parts) > 0 else "",
-            extended_address=parts[1] if len(parts) > 1 else "",
-            street_address=parts[2] if len(parts) > 2 else "",
-            locality=parts[3] if len(parts) > 3 else "",
-            region=parts[4] if len(parts) > 4 else "",
-            postal_code=parts[5] if len(parts) > 5 else "",
-            country_name=parts[6] if len(parts) > 6 else "",
-        )
+        parts = (value.split(';') + [""] * 7)[:7]
+        return StructuredAddress(*parts)
 
     def __str__(self) -> str:
         return f"{self.post_office_box};{self.extended_address};{self.street_address};{self.locality};{self.region};{self.postal_code};{self.country_name}"
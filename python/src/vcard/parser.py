@@ -2,8 +2,36 @@
 vCard Parser for RFC 6350
 """
 
-from typing import List
-from .dom import VCardObject, VCardProperty
+import re
+from itertools import chain
+from typing import Iterable, Iterator, List
+from .dom import VCardObject, VCardProperty, _canon, _iter_parameters
+
+# Escape sequences recognized in property values (RFC 6350 Section 3.4)
+_UNESCAPE_MAP = {
+    'n': '\n',
+    'N': '\n',
+    ';': ';',
+    ',': ',',
+    '\\': '\\',
+}
+
+# A property line is name[;params]:value, where the name and parameters end
+# at the first ';' and ':' outside double quotes (RFC 6350 Section 3.3)
+_PROPERTY_LINE_RE = re.compile(r'((?:"[^"]*"|[^;:"])*)(?:;((?:"[^"]*"|[^:"])*))?:(.*)', re.S)
+
+# Besides CR and LF, str.splitlines() breaks on these, which are ordinary
+# characters inside vCard property values
+_OTHER_LINE_BREAKS = '\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split text into physical lines on CRLF or LF"""
+    # splitlines() avoids copying the text, but is only equivalent when every
+    # CR is part of a CRLF and no other line break characters are present
+    if text.count('\r') == text.count('\r\n') and not any(c in text for c in _OTHER_LINE_BREAKS):
+        return text.splitlines()
+    return text.replace('\r\n', '\n').split('\n')
 
 
 class ParseException(Exception):
@@ -14,29 +42,26 @@ class ParseException(Exception):
 class VCardParser:
     """Parser for text/vcard format (RFC 6350)"""
 
-    def __init__(self):
-        self._lines: List[str] = []
-        self._current_line: int = 0
-
     def parse(self, vcard_text: str) -> List[VCardObject]:
         """Parse vCards from text (returns all vCards found)"""
-        vcards = []
-        self._lines = self._unfold_lines(vcard_text)
-        self._current_line = 0
+        return self._parse_lines(_split_lines(vcard_text))
 
-        while self._current_line < len(self._lines):
-            # Skip empty lines
-            while self._current_line < len(self._lines) and not self._lines[self._current_line].strip():
-                self._current_line += 1
+    def parse_file(self, file_path: str) -> List[VCardObject]:
+        """Parse vCards from a file, reading it line by line"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return self._parse_lines(line.rstrip('\n') for line in f)
 
-            if self._current_line >= len(self._lines):
-                break
+    def _parse_lines(self, lines: Iterable[str]) -> List[VCardObject]:
+        """Parse vCards from physical (still folded) lines"""
+        vcards = []
+        # Components consume their lines from the same iterator
+        unfolded_lines = self._unfold_lines(lines)
 
-            line = self._lines[self._current_line]
-            if line.upper() == "BEGIN:VCARD":
-                self._current_line += 1
+        for line in unfolded_lines:
+            # Only the 11-character line can match, so only that one is uppercased
+            if len(line) == 11 and line.upper() == "BEGIN:VCARD":
                 vcard = VCardObject()
-                self._parse_component(vcard)
+                self._parse_component(unfolded_lines, vcard)
                 vcards.append(vcard)
             else:
                 raise ParseException(f"Expected BEGIN:VCARD but got: {line}")
@@ -46,172 +71,90 @@ class VCardParser:
 
         return vcards
 
-    def parse_file(self, file_path: str) -> List[VCardObject]:
-        """Parse vCards from a file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return self.parse(content)
-
-    def _unfold_lines(self, vcard_text: str) -> List[str]:
+    def _unfold_lines(self, lines: Iterable[str]) -> Iterator[str]:
         """Unfold long lines according to RFC 6350"""
-        unfolded_lines = []
-        lines = vcard_text.replace('\r\n', '\n').split('\n')
-
         current_line = []
 
-        for line in lines:
-            if line and (line[0] == ' ' or line[0] == '\t'):
+        # Trailing sentinel so the last logical line is flushed inside the loop
+        for line in chain(lines, ('',)):
+            if line and line[0] in ' \t':
                 # Continuation line - remove leading whitespace and append
                 current_line.append(line[1:])
-            else:
-                if current_line:
-                    unfolded_line = ''.join(current_line)
-                    if unfolded_line.strip():
-                        unfolded_lines.append(unfolded_line)
-                current_line = [line]
-
-        if current_line:
-            unfolded_line = ''.join(current_line)
-            if unfolded_line.strip():
-                unfolded_lines.append(unfolded_line)
-
-        return unfolded_lines
-
-    def _parse_component(self, component: VCardObject):
-        """Parse properties of a component"""
-        while self._current_line < len(self._lines):
-            line = self._lines[self._current_line]
+                continue
+
+            if current_line:
+                unfolded_line = current_line[0] if len(current_line) == 1 else ''.join(current_line)
+                # Drop blank lines without allocating a stripped copy
+                if unfolded_line and not unfolded_line.isspace():
+                    yield unfolded_line
+            current_line = [line]
+
+    def _parse_component(self, lines: Iterator[str], component: VCardObject):
+        """Parse properties of a component up to and including its END line"""
+        properties = []
+        # Bound once rather than looked up for every line
+        add_property = properties.append
+        parse_property = self._parse_property
 
-            if line.upper().startswith("END:"):
+        for line in lines:
+            if line[:4].upper() == "END:":
                 end_component_type = line[4:].upper()
                 if end_component_type != component.component_type:
                     raise ParseException(
                         f"Mismatched END tag: expected END:{component.component_type} but got END:{end_component_type}"
                     )
-                self._current_line += 1
+
+                component._extend_properties(properties)
 
                 # Validate required properties for vCard
                 self._validate_vcard(component)
 
                 return
             else:
-                prop = self._parse_property(line)
-                component.add_property(prop)
-                self._current_line += 1
+                add_property(parse_property(line))
 
         raise ParseException(f"Unexpected end of input while parsing {component.component_type}")
 
     def _parse_property(self, line: str) -> VCardProperty:
         """Parse a property line"""
-        colon_index = self._find_unquoted_char(line, ':')
-        if colon_index == -1:
+        match = _PROPERTY_LINE_RE.match(line)
+        if match is None:
             raise ParseException(f"Invalid property line (missing colon): {line}")
 
-        name_and_params = line[:colon_index]
-        value = line[colon_index + 1:]
-
-        # Unescape value
-        value = self._unescape_value(value)
-
-        # Parse name and parameters
-        semicolon_index = self._find_unquoted_char(name_and_params, ';')
-
-        if semicolon_index != -1:
-            property_name = name_and_params[:semicolon_index].upper()
-            params_part = name_and_params[semicolon_index + 1:]
-        else:
-            property_name = name_and_params.upper()
-            params_part = None
-
-        prop = VCardProperty(property_name, value)
+        property_name, params_part, value = match.groups()
 
         if params_part:
-            self._parse_parameters(params_part, prop)
-
-        return prop
-
-    def _parse_parameters(self, params_part: str, prop: VCardProperty):
-        """Parse property parameters"""
-        parameters = self._split_parameters(params_part)
-
-        for param in parameters:
-            equals_index = param.find('=')
-            if equals_index == -1:
-                raise ParseException(f"Invalid parameter (missing equals): {param}")
-
-            param_name = param[:equals_index].upper()
-            param_value = param[equals_index + 1:]
-
-            # Remove quotes if present
-            if param_value.startswith('"') and param_value.endswith('"') and len(param_value) >= 2:
-                param_value = param_value[1:-1]
-
-            # Handle comma-separated values
-            values = self._split_parameter_values(param_value)
-            for value in values:
-                prop.add_parameter(param_name, value)
-
-    def _split_parameters(self, params_part: str) -> List[str]:
-        """Split parameters by semicolon, respecting quotes"""
-        parameters = []
-        current = []
-        in_quotes = False
-
-        for c in params_part:
-            if c == '"':
-                in_quotes = not in_quotes
-                current.append(c)
-            elif c == ';' and not in_quotes:
-                parameters.append(''.join(current))
-                current = []
-            else:
-                current.append(c)
-
-        if current:
-            parameters.append(''.join(current))
+            # Only the syntax is checked here; values are decoded on first access
+            self._check_parameters(params_part)
 
-        return parameters
+        return VCardProperty._from_parsed(_canon(property_name), self._unescape_value(value), params_part)
 
-    def _split_parameter_values(self, param_value: str) -> List[str]:
-        """Split parameter values by comma, respecting quotes"""
-        values = []
-        current = []
-        in_quotes = False
-
-        for c in param_value:
-            if c == '"':
-                in_quotes = not in_quotes
-            elif c == ',' and not in_quotes:
-                values.append(''.join(current))
-                current = []
-            else:
-                current.append(c)
-
-        if current:
-            values.append(''.join(current))
-
-        return values
-
-    def _find_unquoted_char(self, s: str, target: str) -> int:
-        """Find the first occurrence of target not inside quotes"""
-        in_quotes = False
-        for i, c in enumerate(s):
-            if c == '"':
-                in_quotes = not in_quotes
-            elif c == target and not in_quotes:
-                return i
-        return -1
+    def _check_parameters(self, params_part: str):
+        """Check property parameter syntax without decoding the values"""
+        try:
+            for _ in _iter_parameters(params_part):
+                pass
+        except ValueError as ex:
+            raise ParseException(str(ex)) from None
 
     def _unescape_value(self, value: str) -> str:
         """Unescape special characters in value"""
-        return (
-            value
-            .replace('\\n', '\n')
-            .replace('\\N', '\n')
-            .replace('\\;', ';')
-            .replace('\\,', ',')
-            .replace('\\\\', '\\')
-        )
+        if '\\' not in value:
+            return value
+
+        out = []
+        index = 0
+        while True:
+            backslash = value.find('\\', index)
+            if backslash == -1:
+                out.append(value[index:])
+                break
+            out.append(value[index:backslash])
+            escaped = value[backslash + 1:backslash + 2]
+            out.append(_UNESCAPE_MAP.get(escaped, '\\' + escaped))
+            index = backslash + 2
+
+        return ''.join(out)
 
     def _validate_vcard(self, vcard: VCardObject):
         """Validate required vCard properties"""
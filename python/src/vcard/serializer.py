@@ -2,9 +2,16 @@
 vCard Serializer for RFC 6350
 """
 
-from typing import List
+import io
+from typing import Iterable, Iterator
 from .dom import VCardObject, VCardProperty
 
+# Characters that must be escaped in property values (RFC 6350 Section 3.4)
+_ESCAPED_CHARS = frozenset('\\;,\n\r')
+
+# Characters that require a parameter value to be quoted
+_QUOTED_CHARS = frozenset(':;, \t')
+
 
 class VCardSerializer:
     """Serializer for text/vcard format (RFC 6350)"""
@@ -13,99 +20,112 @@ class VCardSerializer:
 
     def serialize(self, vcard: VCardObject) -> str:
         """Serialize a VCardObject to vCard format string"""
-        lines = []
-        self._serialize_component(vcard, lines)
-        return '\r\n'.join(lines) + '\r\n'
+        buf = io.StringIO()
+        self._serialize_component(vcard, buf)
+        return buf.getvalue()
 
-    def serialize_multiple(self, vcards: List[VCardObject]) -> str:
+    def serialize_multiple(self, vcards: Iterable[VCardObject]) -> str:
         """Serialize multiple VCardObjects to vCard format string"""
-        result = []
+        return ''.join(self.iter_serialize(vcards))
+
+    def iter_serialize(self, vcards: Iterable[VCardObject]) -> Iterator[str]:
+        """Serialize VCardObjects one at a time, yielding each vCard's text"""
         for vcard in vcards:
-            result.append(self.serialize(vcard))
-        return ''.join(result)
+            yield self.serialize(vcard)
 
     def serialize_to_file(self, vcard: VCardObject, file_path: str):
         """Serialize a VCardObject to a file"""
         content = self.serialize(vcard)
-        with open(file_path, 'w', encoding='utf-8') as f:
+        # newline='' keeps the CRLF line endings untranslated on every platform
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
             f.write(content)
 
-    def serialize_multiple_to_file(self, vcards: List[VCardObject], file_path: str):
-        """Serialize multiple VCardObjects to a file"""
-        content = self.serialize_multiple(vcards)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    def serialize_multiple_to_file(self, vcards: Iterable[VCardObject], file_path: str):
+        """Serialize multiple VCardObjects to a file, one vCard at a time"""
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(self.iter_serialize(vcards))
 
-    def _serialize_component(self, component: VCardObject, lines: List[str]):
-        """Serialize a component to lines"""
+    def _serialize_component(self, component: VCardObject, buf: io.StringIO):
+        """Serialize a component to the output buffer"""
         # Write BEGIN
-        self._write_line(lines, f"BEGIN:{component.component_type}")
+        self._write_line(buf, f"BEGIN:{component.component_type}")
 
         # Write VERSION first if present
         version_prop = component.get_property("VERSION")
         if version_prop:
-            self._serialize_property(version_prop, lines)
+            self._serialize_property(version_prop, buf)
 
-        # Write all other properties
-        for prop_list in component.properties.values():
-            for prop in prop_list:
-                # Skip VERSION as it's already written
-                if prop.name != "VERSION":
-                    self._serialize_property(prop, lines)
+        # Write all other properties in document order
+        serialize_property = self._serialize_property
+        for prop in component.properties:
+            # Skip VERSION as it's already written
+            if prop.name != "VERSION":
+                serialize_property(prop, buf)
 
         # Write END
-        self._write_line(lines, f"END:{component.component_type}")
+        self._write_line(buf, f"END:{component.component_type}")
+
+    def _serialize_property(self, prop: VCardProperty, buf: io.StringIO):
+        """Serialize a property to the output buffer"""
+        value = self._escape_value(prop.value)
+
+        # Parsed parameters that cannot have been modified are written back
+        # verbatim instead of being re-quoted from their decoded form
+        if prop._params_raw is not None:
+            self._write_line(buf, f"{prop.name};{prop._params_raw}:{value}")
+            return
+
+        # Short lines without parameters go straight to the buffer
+        if not prop._parameters and len(prop.name) + len(value) < self.MAX_LINE_LENGTH:
+            buf.write(prop.name)
+            buf.write(':')
+            buf.write(value)
+            buf.write('\r\n')
+            return
 
-    def _serialize_property(self, prop: VCardProperty, lines: List[str]):
-        """Serialize a property to lines"""
         line_parts = [prop.name]
+        add_part = line_parts.append
+        needs_quoting = self._needs_quoting
 
         # Add parameters
-        if prop.parameters:
-            for param_name, param_values in prop.parameters.items():
-                for param_value in param_values:
-                    line_parts.append(';')
-                    line_parts.append(param_name)
-                    line_parts.append('=')
-
-                    # Quote parameter value if it contains special characters
-                    if self._needs_quoting(param_value):
-                        line_parts.append('"')
-                        line_parts.append(param_value)
-                        line_parts.append('"')
-                    else:
-                        line_parts.append(param_value)
+        for param_name, param_values in prop._parameters.items():
+            for param_value in param_values:
+                # Quote parameter value if it contains special characters
+                if needs_quoting(param_value):
+                    add_part(f';{param_name}="{param_value}"')
+                else:
+                    add_part(f';{param_name}={param_value}')
 
         line_parts.append(':')
-        line_parts.append(self._escape_value(prop.value))
+        line_parts.append(value)
 
-        line = ''.join(line_parts)
-        self._write_line(lines, line)
+        self._write_line(buf, ''.join(line_parts))
 
-    def _write_line(self, lines: List[str], line: str):
+    def _write_line(self, buf: io.StringIO, line: str):
         """Write a line, folding if necessary"""
         if len(line) <= self.MAX_LINE_LENGTH:
-            lines.append(line)
+            buf.write(line)
+            buf.write('\r\n')
             return
 
-        # Fold long lines (RFC 6350 Section 3.2)
-        first_line = line[:self.MAX_LINE_LENGTH]
-        lines.append(first_line)
-
-        remaining = line[self.MAX_LINE_LENGTH:]
-        while remaining:
-            chunk_length = min(self.MAX_LINE_LENGTH - 1, len(remaining))
-            chunk = remaining[:chunk_length]
-            lines.append(' ' + chunk)
-            remaining = remaining[chunk_length:]
+        # Fold long lines (RFC 6350 Section 3.2): the first line holds
+        # MAX_LINE_LENGTH characters, each continuation line a leading space
+        # plus MAX_LINE_LENGTH - 1 characters
+        step = self.MAX_LINE_LENGTH
+        write = buf.write
+        write(line[:step])
+        for start in range(step, len(line), step - 1):
+            write('\r\n ')
+            write(line[start:start + step - 1])
+        write('\r\n')
 
     def _needs_quoting(self, value: str) -> bool:
         """Check if a parameter value needs quoting"""
-        return any(c in value for c in ':;, \t')
+        return not _QUOTED_CHARS.isdisjoint(value)
 
     def _escape_value(self, value: str) -> str:
         """Escape special characters in value"""
-        if not value:
+        if not value or _ESCAPED_CHARS.isdisjoint(value):
             return value
 
         return (
@@ -3,80 +3,124 @@ vCard Validator for RFC 6350
 """
 
 import re
-from typing import List
-from .dom import VCardObject
+from typing import Callable, List, Optional
+from .dom import VCardObject, VCardProperty
+
+# Basic email shape: something@domain.tld without whitespace
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Accepted VERSION values; 3.0 and 2.1 only for backward compatibility
+_VALID_VERSIONS = frozenset(("4.0", "3.0", "2.1"))
+_VALID_VERSIONS_STR = "4.0, 3.0, 2.1"
+
+# TEL TYPE values defined by RFC 6350 Sections 5.6 and 6.4.1
+_VALID_TEL_TYPES = frozenset((
+    "work", "home", "text", "voice", "fax", "cell", "video", "pager", "textphone",
+))
+
+# URL schemes accepted without a warning
+_URL_SCHEMES = ('http://', 'https://', 'ftp://')
+
+
+def _is_blank(value: str) -> bool:
+    """Check whether a value is empty or whitespace only, without copying it"""
+    return not value or value.isspace()
 
 
 class ValidationResult:
     """Result of validation operation"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        on_error: Optional[Callable[[str], None]] = None,
+        on_warning: Optional[Callable[[str], None]] = None
+    ):
+        """Collect messages, or pass them to the given callbacks instead of storing them"""
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self._on_error = on_error
+        self._on_warning = on_warning
+        # Messages handed to a callback are counted instead of stored
+        self._streamed_errors = 0
+        self._streamed_warnings = 0
 
     @property
     def is_valid(self) -> bool:
-        """Check if validation passed (no errors)"""
-        return len(self.errors) == 0
+        """Check if validation passed (no errors stored or streamed)"""
+        return not self.errors and self._streamed_errors == 0
 
     def add_error(self, error: str):
         """Add an error message"""
-        self.errors.append(error)
+        if self._on_error is None:
+            self.errors.append(error)
+        else:
+            self._streamed_errors += 1
+            self._on_error(error)
 
     def add_warning(self, warning: str):
         """Add a warning message"""
-        self.warnings.append(warning)
+        if self._on_warning is None:
+            self.warnings.append(warning)
+        else:
+            self._streamed_warnings += 1
+            self._on_warning(warning)
 
     def get_summary(self) -> str:
         """Get a summary of validation results"""
-        summary = f"Validation Result: {'VALID' if self.is_valid else 'INVALID'}\n"
-        summary += f"Errors: {len(self.errors)}\n"
-        summary += f"Warnings: {len(self.warnings)}\n"
+        parts = [
+            f"Validation Result: {'VALID' if self.is_valid else 'INVALID'}\n",
+            f"Errors: {len(self.errors) + self._streamed_errors}\n",
+            f"Warnings: {len(self.warnings) + self._streamed_warnings}\n",
+        ]
 
         if self.errors:
-            summary += "\nErrors:\n"
-            for error in self.errors:
-                summary += f"  - {error}\n"
+            parts.append("\nErrors:\n")
+            parts.extend(f"  - {error}\n" for error in self.errors)
 
         if self.warnings:
-            summary += "\nWarnings:\n"
-            for warning in self.warnings:
-                summary += f"  - {warning}\n"
+            parts.append("\nWarnings:\n")
+            parts.extend(f"  - {warning}\n" for warning in self.warnings)
 
-        return summary
+        return ''.join(parts)
 
 
 class VCardValidator:
     """Validator for vCard components according to RFC 6350"""
 
-    def validate(self, vcard: VCardObject) -> ValidationResult:
-        """Validate a vCard object"""
-        result = ValidationResult()
+    def validate(self, vcard: VCardObject, result: Optional[ValidationResult] = None) -> ValidationResult:
+        """Validate a vCard object, adding to the given result if one is passed"""
+        if result is None:
+            result = ValidationResult()
         self._validate_vcard(vcard, result)
         return result
 
     def _validate_vcard(self, vcard: VCardObject, result: ValidationResult):
         """Validate vCard properties"""
+        # Each property is looked up once and shared by the checks below
+        version = vcard.get_property("VERSION")
+        fn = vcard.get_property("FN")
+
         # VCARD MUST have VERSION and FN
-        self._validate_required_property(vcard, "VERSION", result)
-        self._validate_required_property(vcard, "FN", result)
+        self._validate_required_property(version, "VERSION", result)
+        self._validate_required_property(fn, "FN", result)
 
         # VERSION must be 4.0 (or 3.0, 2.1 for backward compatibility)
-        version = vcard.get_property("VERSION")
         if version:
-            valid_versions = ["4.0", "3.0", "2.1"]
-            if version.value not in valid_versions:
-                result.add_error(
-                    f"VERSION must be one of: {', '.join(valid_versions)}, found: {version.value}"
-                )
-            elif version.value != "4.0":
+            version_value = version.value
+            # 4.0 is the common case and needs no set lookup
+            if version_value == "4.0":
+                pass
+            elif version_value in _VALID_VERSIONS:
                 result.add_warning(
-                    f"VERSION {version.value} is supported but deprecated. Consider upgrading to 4.0"
+                    f"VERSION {version_value} is supported but deprecated. Consider upgrading to 4.0"
+                )
+            else:
+                result.add_error(
+                    f"VERSION must be one of: {_VALID_VERSIONS_STR}, found: {version_value}"
                 )
 
         # FN (Formatted Name) must not be empty
-        fn = vcard.get_property("FN")
-        if fn and not fn.value.strip():
+        if fn and _is_blank(fn.value):
             result.add_error("FN (Formatted Name) cannot be empty")
 
         # Validate telephones
@@ -95,50 +139,53 @@ class VCardValidator:
         for url in vcard.urls:
             self._validate_url(url, result)
 
-    def _validate_required_property(self, vcard: VCardObject, property_name: str, result: ValidationResult):
+    def _validate_required_property(self, prop: Optional[VCardProperty], property_name: str, result: ValidationResult):
         """Validate that a required property is present"""
-        prop = vcard.get_property(property_name)
         if not prop:
             result.add_error(f"Required property {property_name} is missing")
 
     def _validate_telephone(self, prop, result: ValidationResult):
         """Validate a telephone property"""
-        if not prop.value.strip():
+        if _is_blank(prop.value):
             result.add_error("TEL property cannot be empty")
 
         # Validate TYPE parameter if present
         types = prop.get_parameters("TYPE")
-        valid_types = ["work", "home", "text", "voice", "fax", "cell", "video", "pager", "textphone"]
         for type_val in types:
-            if type_val.lower() not in valid_types:
+            # The DOM stores TYPE values lowercase, but values written into
+            # the parameters dict directly are kept as given
+            if type_val not in _VALID_TEL_TYPES and type_val.lower() not in _VALID_TEL_TYPES:
                 result.add_warning(f"TEL TYPE parameter has non-standard value: {type_val}")
 
     def _validate_email(self, prop, result: ValidationResult):
         """Validate an email property"""
-        if not prop.value.strip():
+        if _is_blank(prop.value):
             result.add_error("EMAIL property cannot be empty")
             return
 
-        # Basic email validation
-        email_pattern = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
-        if not re.match(email_pattern, prop.value):
+        # Basic email validation; a value without '@' cannot match the pattern
+        if '@' not in prop.value or not _EMAIL_RE.match(prop.value):
             result.add_warning(f"EMAIL property may not be a valid email address: {prop.value}")
 
     def _validate_address(self, prop, result: ValidationResult):
         """Validate an address property"""
         # ADR property format: POBox;Extended;Street;Locality;Region;PostalCode;Country
-        parts = prop.value.split(';')
-        if len(parts) != 7:
+        # Split at most six times so stray semicolons cannot grow the list;
+        # any left over end up in the last component
+        parts = prop.value.split(';', 6)
+        if len(parts) != 7 or ';' in parts[6]:
             result.add_warning(
-                f"ADR property should have exactly 7 components, found {len(parts)}: {prop.value}"
+                f"ADR property should have exactly 7 components, found {prop.value.count(';') + 1}: {prop.value}"
             )
 
     def _validate_url(self, prop, result: ValidationResult):
         """Validate a URL property"""
-        if not prop.value.strip():
+        value = prop.value
+        if _is_blank(value):
             result.add_error("URL property cannot be empty")
             return
 
-        # Basic URL validation
-        if not prop.value.startswith(('http://', 'https://', 'ftp://')):
-            result.add_warning(f"URL property may not be a valid URL: {prop.value}")
+        # Basic URL validation; a single startswith() call checks every
+        # scheme in C
+        if not value.startswith(_URL_SCHEMES):
+            result.add_warning(f"URL property may not be a valid URL: {value}")
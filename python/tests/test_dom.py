@@ -0,0 +1,44 @@
+"""
+Tests for the vCard document object model
+"""
+
+import pytest
+
+from vcard.dom import VCardObject, VCardProperty
+from vcard.serializer import VCardSerializer
+
+
+def make_vcard() -> VCardObject:
+    """A vCard with one telephone number."""
+    vcard = VCardObject()
+    vcard.add_property(VCardProperty("VERSION", "4.0"))
+    vcard.add_property(VCardProperty("FN", "John Doe"))
+    vcard.add_property(VCardProperty("TEL", "1"))
+    return vcard
+
+
+def test_get_properties_returns_a_copy():
+    """Test that changing a get_properties result does not desync the component"""
+    vcard = make_vcard()
+    vcard.get_properties("TEL").append(VCardProperty("TEL", "2"))
+
+    assert [prop.value for prop in vcard.telephones] == ["1"]
+    assert "TEL:2" not in VCardSerializer().serialize(vcard)
+
+
+def test_properties_is_read_only():
+    """Test that properties cannot be appended to behind the name index"""
+    vcard = make_vcard()
+
+    with pytest.raises(AttributeError):
+        vcard.properties.append(VCardProperty("TEL", "2"))
+
+
+def test_add_property_updates_both_views():
+    """Test that add_property is reflected in properties, get_properties and the output"""
+    vcard = make_vcard()
+    vcard.add_property(VCardProperty("TEL", "2"))
+
+    assert [prop.value for prop in vcard.get_properties("TEL")] == ["1", "2"]
+    assert [prop.name for prop in vcard.properties] == ["VERSION", "FN", "TEL", "TEL"]
+    assert "TEL:1\r\nTEL:2\r\n" in VCardSerializer().serialize(vcard)
@@ -3,12 +3,14 @@ Negative tests for vCard parser to ensure proper error handling
 """
 
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
 from vcard.parser import VCardParser, ParseException
 
 
+@lru_cache(maxsize=1)
 def get_negative_testcases_dir() -> Path:
     """Find the testcases/negative directory."""
     current = Path(__file__).parent
@@ -20,20 +22,25 @@ def get_negative_testcases_dir() -> Path:
     raise FileNotFoundError("Could not find testcases/negative directory")
 
 
+@pytest.fixture(scope="module")
+def parser() -> VCardParser:
+    """Share one parser across the tests in this module."""
+    return VCardParser()
+
+
 def read_test_file(filename: str) -> str:
     """Read a negative test file."""
     testcases_dir = get_negative_testcases_dir()
     file_path = testcases_dir / filename
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    # Decode the raw bytes so line endings reach the parser untranslated
+    return file_path.read_bytes().decode('utf-8')
 
 
 # Structural Errors
 
-def test_missing_begin_should_raise():
+def test_missing_begin_should_raise(parser):
     """Test that missing BEGIN:VCARD raises ParseException"""
     content = read_test_file("missing_begin.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -42,10 +49,9 @@ def test_missing_begin_should_raise():
         "Error message should indicate missing BEGIN"
 
 
-def test_missing_end_should_raise():
+def test_missing_end_should_raise(parser):
     """Test that missing END:VCARD raises ParseException"""
     content = read_test_file("missing_end.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -54,10 +60,9 @@ def test_missing_end_should_raise():
         "Error message should indicate missing END"
 
 
-def test_incomplete_vcard_should_raise():
+def test_incomplete_vcard_should_raise(parser):
     """Test that incomplete vCard raises ParseException"""
     content = read_test_file("incomplete_vcard.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -65,10 +70,9 @@ def test_incomplete_vcard_should_raise():
     assert "Unexpected end of input" in str(exc_info.value)
 
 
-def test_mismatched_begin_end_should_raise():
+def test_mismatched_begin_end_should_raise(parser):
     """Test that mismatched BEGIN/END tags raise ParseException"""
     content = read_test_file("mismatched_begin_end.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -77,10 +81,9 @@ def test_mismatched_begin_end_should_raise():
         "Error should indicate mismatched tags"
 
 
-def test_wrong_component_type_should_raise():
+def test_wrong_component_type_should_raise(parser):
     """Test that wrong component type raises ParseException"""
     content = read_test_file("wrong_component_type.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -89,10 +92,9 @@ def test_wrong_component_type_should_raise():
         "Should expect BEGIN:VCARD"
 
 
-def test_empty_file_should_raise():
+def test_empty_file_should_raise(parser):
     """Test that empty file raises ParseException"""
     content = read_test_file("empty_file.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -100,10 +102,9 @@ def test_empty_file_should_raise():
     assert "No vCard data found" in str(exc_info.value)
 
 
-def test_only_whitespace_should_raise():
+def test_only_whitespace_should_raise(parser):
     """Test that file with only whitespace raises ParseException"""
     content = read_test_file("only_whitespace.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -113,10 +114,9 @@ def test_only_whitespace_should_raise():
 
 # Required Property Violations
 
-def test_missing_version_should_raise():
+def test_missing_version_should_raise(parser):
     """Test that missing VERSION property raises ParseException"""
     content = read_test_file("missing_version.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -126,10 +126,9 @@ def test_missing_version_should_raise():
     assert "RFC 6350" in error_msg, "Error should reference the RFC"
 
 
-def test_missing_fn_should_raise():
+def test_missing_fn_should_raise(parser):
     """Test that missing FN property raises ParseException"""
     content = read_test_file("missing_fn.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -142,10 +141,9 @@ def test_missing_fn_should_raise():
 
 # Version Support
 
-def test_unsupported_version_21_should_raise():
+def test_unsupported_version_21_should_raise(parser):
     """Test that vCard version 2.1 raises ParseException"""
     content = read_test_file("unsupported_version_2_1.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -161,10 +159,9 @@ def test_unsupported_version_21_should_raise():
         f"Expected either version error or parameter syntax error, got: {error_msg}"
 
 
-def test_unsupported_version_30_should_raise():
+def test_unsupported_version_30_should_raise(parser):
     """Test that vCard version 3.0 raises ParseException"""
     content = read_test_file("unsupported_version_3_0.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -176,10 +173,9 @@ def test_unsupported_version_30_should_raise():
     assert "4.0" in error_msg, "Error should mention supported version 4.0"
 
 
-def test_unsupported_version_10_should_raise():
+def test_unsupported_version_10_should_raise(parser):
     """Test that vCard version 1.0 raises ParseException"""
     content = read_test_file("unsupported_version_1_0.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -190,10 +186,9 @@ def test_unsupported_version_10_should_raise():
     assert "1.0" in error_msg, "Error should mention version 1.0"
 
 
-def test_invalid_version_format_should_raise():
+def test_invalid_version_format_should_raise(parser):
     """Test that invalid version format raises ParseException"""
     content = read_test_file("invalid_version_format.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -205,10 +200,9 @@ def test_invalid_version_format_should_raise():
 
 # Syntax Errors
 
-def test_malformed_property_no_colon_should_raise():
+def test_malformed_property_no_colon_should_raise(parser):
     """Test that property without colon raises ParseException"""
     content = read_test_file("malformed_property_no_colon.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -218,10 +212,9 @@ def test_malformed_property_no_colon_should_raise():
     assert "TEL" in error_msg, "Error should show the problematic line"
 
 
-def test_malformed_parameter_syntax_should_raise():
+def test_malformed_parameter_syntax_should_raise(parser):
     """Test that malformed parameter syntax raises ParseException"""
     content = read_test_file("malformed_parameter_syntax.vcf")
-    parser = VCardParser()
 
     with pytest.raises(ParseException) as exc_info:
         parser.parse(content)
@@ -233,59 +226,34 @@ def test_malformed_parameter_syntax_should_raise():
 
 # Multiple Test Cases Runner
 
-def test_critical_negative_test_files_should_raise():
-    """
-    Test that critical negative test files raise exceptions.
-    Note: Some tests are lenient (e.g., duplicate properties, unknown parameter values)
-    which is acceptable parser behavior. This test focuses on critical errors only.
-    """
-    # These are critical errors that MUST be rejected
-    critical_tests = [
-        "missing_begin.vcf",
-        "missing_end.vcf",
-        "missing_version.vcf",
-        "missing_fn.vcf",
-        "empty_file.vcf",
-        "only_whitespace.vcf",
-        "incomplete_vcard.vcf",
-        "malformed_property_no_colon.vcf",
-        "malformed_parameter_syntax.vcf",
-        "unsupported_version_2_1.vcf",
-        "unsupported_version_3_0.vcf",
-        "unsupported_version_1_0.vcf",
-        "wrong_component_type.vcf",
-        "mismatched_begin_end.vcf"
-    ]
-
-    parser = VCardParser()
-    passed_count = 0
-    failed_tests = []
-
-    for filename in critical_tests:
-        try:
-            content = read_test_file(filename)
-            parser.parse(content)
-
-            # If we get here, the parser didn't raise - this is a failure
-            failed_tests.append(
-                f"{filename}: Parser accepted invalid vCard (should have raised exception)"
-            )
-        except ParseException as ex:
-            # Expected - negative test should raise
-            passed_count += 1
-            print(f"✓ {filename}: {str(ex)[:80]}...")
-        except Exception as ex:
-            # Unexpected exception type
-            failed_tests.append(
-                f"{filename}: Unexpected exception type: {type(ex).__name__}"
-            )
-
-    # Report results
-    print(f"\nCritical Negative Tests Summary: {passed_count}/{len(critical_tests)} passed")
-
-    if failed_tests:
-        failure_message = "Some critical negative tests failed:\n" + "\n".join(failed_tests)
-        pytest.fail(failure_message)
+# These are critical errors that MUST be rejected.
+# Note: Some tests are lenient (e.g., duplicate properties, unknown parameter values)
+# which is acceptable parser behavior. Only critical errors are listed here.
+CRITICAL_TESTS = [
+    "missing_begin.vcf",
+    "missing_end.vcf",
+    "missing_version.vcf",
+    "missing_fn.vcf",
+    "empty_file.vcf",
+    "only_whitespace.vcf",
+    "incomplete_vcard.vcf",
+    "malformed_property_no_colon.vcf",
+    "malformed_parameter_syntax.vcf",
+    "unsupported_version_2_1.vcf",
+    "unsupported_version_3_0.vcf",
+    "unsupported_version_1_0.vcf",
+    "wrong_component_type.vcf",
+    "mismatched_begin_end.vcf"
+]
+
+
+@pytest.mark.parametrize("filename", CRITICAL_TESTS)
+def test_critical_negative_test_file_should_raise(parser, filename: str):
+    """Test that a critical negative test file raises ParseException"""
+    content = read_test_file(filename)
+
+    with pytest.raises(ParseException):
+        parser.parse(content)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""
+Tests for the vCard parser
+"""
+
+import pytest
+
+from vcard.parser import VCardParser
+
+
+def parse_single(*property_lines: str):
+    """Parse one vCard containing VERSION, FN and the given property lines."""
+    lines = ["BEGIN:VCARD", "VERSION:4.0", "FN:John Doe", *property_lines, "END:VCARD"]
+    return VCardParser().parse("\r\n".join(lines) + "\r\n")[0]
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("C:\\\\new", "C:\\new"),        # escaped backslash followed by n
+    ("a\\nb", "a\nb"),
+    ("a\\Nb", "a\nb"),
+    ("a\\;b", "a;b"),
+    ("a\\,b", "a,b"),
+    ("a\\xb", "a\\xb"),              # unknown escapes are kept as written
+    ("trailing\\", "trailing\\"),    # a lone backslash at the end is kept
+    ("no escapes", "no escapes"),
+])
+def test_unescape_value(raw: str, expected: str):
+    """Test that value escapes are decoded in a single left-to-right pass"""
+    vcard = parse_single(f"NOTE:{raw}")
+
+    assert vcard.get_property("NOTE").value == expected
+
+
+def test_type_parameter_values_are_lowercased():
+    """Test that parsed TYPE values are stored lowercase, other parameters as written"""
+    vcard = parse_single('TEL;TYPE=WORK,Voice;type="CELL,x-Foo";VALUE=URI:tel:+1-555-0100')
+    tel = vcard.get_property("TEL")
+
+    assert tel.get_parameters("TYPE") == ["work", "voice", "cell", "x-foo"]
+    assert tel.get_parameter("VALUE") == "URI"
+
+
+def test_added_type_parameter_values_are_lowercased():
+    """Test that add_parameter stores TYPE values lowercase"""
+    tel = parse_single("TEL:1").get_property("TEL")
+    tel.add_parameter("type", "HOME")
+    tel.add_parameter("TYPE", "X-Custom")
+
+    assert tel.get_parameters("TYPE") == ["home", "x-custom"]
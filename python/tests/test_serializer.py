@@ -0,0 +1,105 @@
+"""
+Tests for the vCard serializer
+"""
+
+from vcard.parser import VCardParser
+from vcard.serializer import VCardSerializer
+from vcard.validator import VCardValidator
+
+
+VCARD_WITH_PARAMETERS = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:4.0\r\n"
+    "FN:John Doe\r\n"
+    "TEL;TYPE=WORK,Bogus:1\r\n"
+    "END:VCARD\r\n"
+)
+
+
+def test_unmodified_parameters_are_written_verbatim():
+    """Test that parsed parameters are serialized exactly as written"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+
+    assert VCardSerializer().serialize(vcard) == VCARD_WITH_PARAMETERS
+
+
+def test_reading_parameters_does_not_change_output():
+    """Test that read-only parameter access leaves the serialized form unchanged"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+    tel = vcard.get_property("TEL")
+
+    assert tel.get_parameter("TYPE") == "work"
+    assert tel.get_parameters("TYPE") == ["work", "bogus"]
+    VCardValidator().validate(vcard)
+
+    assert VCardSerializer().serialize(vcard) == VCARD_WITH_PARAMETERS
+
+
+def test_modified_parameters_are_reserialized():
+    """Test that adding a parameter re-serializes from the decoded parameters"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+    vcard.get_property("TEL").add_parameter("PREF", "1")
+
+    assert "TEL;TYPE=work;TYPE=bogus;PREF=1:1\r\n" in VCardSerializer().serialize(vcard)
+
+
+def test_parameters_dict_access_is_treated_as_modification():
+    """Test that changes made through the parameters dict are serialized"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+    vcard.get_property("TEL").parameters["TYPE"].remove("bogus")
+
+    assert "TEL;TYPE=work:1\r\n" in VCardSerializer().serialize(vcard)
+
+
+def test_get_parameters_list_edits_do_not_diverge_from_output():
+    """Test that editing a get_parameters result cannot desync the DOM and the output"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+    tel = vcard.get_property("TEL")
+    tel.get_parameters("TYPE").remove("bogus")
+
+    assert tel.get_parameters("TYPE") == ["work", "bogus"]
+    assert VCardSerializer().serialize(vcard) == VCARD_WITH_PARAMETERS
+
+
+def test_get_parameters_list_edits_apply_after_modification():
+    """Test that get_parameters returns the live list once the parameters were modified"""
+    vcard = VCardParser().parse(VCARD_WITH_PARAMETERS)[0]
+    tel = vcard.get_property("TEL")
+    tel.add_parameter("PREF", "1")
+    tel.get_parameters("TYPE").remove("bogus")
+
+    assert tel.get_parameters("TYPE") == ["work"]
+    assert "TEL;TYPE=work;PREF=1:1\r\n" in VCardSerializer().serialize(vcard)
+
+
+def make_vcards():
+    """Build a few distinct vCards, including one with a folded line."""
+    parser = VCardParser()
+    for name in ["John Doe", "Jane Roe", "A" * 100]:
+        yield parser.parse(
+            "BEGIN:VCARD\r\n"
+            "VERSION:4.0\r\n"
+            f"FN:{name}\r\n"
+            "END:VCARD\r\n"
+        )[0]
+
+
+def test_serialize_multiple_to_file_from_generator(tmp_path):
+    """Test that writing a generator of vCards matches serialize_multiple"""
+    serializer = VCardSerializer()
+    file_path = tmp_path / "contacts.vcf"
+
+    serializer.serialize_multiple_to_file(make_vcards(), str(file_path))
+
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        written = f.read()
+    assert written == serializer.serialize_multiple(list(make_vcards()))
+    assert written.count("BEGIN:VCARD\r\n") == 3
+
+
+def test_iter_serialize_yields_one_vcard_at_a_time():
+    """Test that iter_serialize yields each vCard's text separately"""
+    serializer = VCardSerializer()
+    vcards = list(make_vcards())
+
+    assert list(serializer.iter_serialize(iter(vcards))) == [serializer.serialize(vcard) for vcard in vcards]
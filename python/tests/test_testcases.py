@@ -5,8 +5,9 @@ Each .vcf file has a corresponding .json file with expected data.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pytest
 
 from vcard.parser import VCardParser
@@ -15,6 +16,7 @@ from vcard.dom import VCardObject, VCardProperty
 from vcard.builder import VCardBuilder, TelType, EmailType, AdrType
 
 
+@lru_cache(maxsize=1)
 def get_testcases_dir() -> Path:
     """Find the testcases directory."""
     current = Path(__file__).parent
@@ -26,7 +28,8 @@ def get_testcases_dir() -> Path:
     raise FileNotFoundError("Could not find testcases directory")
 
 
-def get_test_files() -> List[tuple]:
+@lru_cache(maxsize=1)
+def get_test_files() -> Tuple[tuple, ...]:
     """Get all .vcf/.json test file pairs."""
     testcases_dir = get_testcases_dir()
     vcf_files = sorted(testcases_dir.glob("*.vcf"))
@@ -37,7 +40,12 @@ def get_test_files() -> List[tuple]:
         if json_file.exists():
             test_files.append((vcf_file.stem, str(vcf_file), str(json_file)))
 
-    return test_files
+    return tuple(test_files)
+
+
+def read_vcf_file(vcf_path: str) -> str:
+    """Read a .vcf file without newline translation."""
+    return Path(vcf_path).read_bytes().decode('utf-8')
 
 
 def assert_property(test_name: str, property_path: str, expected: Optional[str], actual: Optional[str]):
@@ -100,8 +108,7 @@ def test_parse_vcf_compare_to_json(test_name: str, vcf_path: str, json_path: str
     """
     # Parse VCF file
     parser = VCardParser()
-    with open(vcf_path, 'r', encoding='utf-8') as f:
-        vcf_text = f.read()
+    vcf_text = read_vcf_file(vcf_path)
     vcards = parser.parse(vcf_text)
 
     # Load expected JSON data
@@ -256,7 +263,7 @@ def create_vcard_from_json(data: Dict[str, Any]) -> VCardObject:
                         types.append(adr_type)
             builder = builder.with_address_parts(
                 po_box=adr_data.get('pobox', ''),
-                extended=adr_data.get('extended', ''),
+                extended_address=adr_data.get('extended', ''),
                 street=adr_data.get('street', ''),
                 locality=adr_data.get('locality', ''),
                 region=adr_data.get('region', ''),
@@ -280,50 +287,97 @@ def create_vcard_from_json(data: Dict[str, Any]) -> VCardObject:
     return builder.build()
 
 
+def load_vcards_from_json(json_path: str) -> List[VCardObject]:
+    """Build one VCardObject per entry of a JSON test file."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        test_data = json.load(f)
+    return [create_vcard_from_json(vcard_data) for vcard_data in test_data['vcards']]
+
+
+def assert_vcards_match(test_name: str, expected_vcards: List[VCardObject], actual_vcards: List[VCardObject]):
+    """Compare the key properties of two lists of vCards."""
+    assert len(actual_vcards) == len(expected_vcards), \
+        f"{test_name}: Expected {len(expected_vcards)} vCards, got {len(actual_vcards)}"
+
+    for i, (expected_vcard, actual_vcard) in enumerate(zip(expected_vcards, actual_vcards)):
+        assert_property(test_name, f"vCard[{i}].VERSION", expected_vcard.version, actual_vcard.version)
+        assert_property(test_name, f"vCard[{i}].FN", expected_vcard.formatted_name, actual_vcard.formatted_name)
+
+        # For semantic comparison, check that key properties match
+        if expected_vcard.name:
+            assert_property(test_name, f"vCard[{i}].N", expected_vcard.name, actual_vcard.name)
+
+
 @pytest.mark.parametrize("test_name,vcf_path,json_path", get_test_files())
 def test_create_from_json_compare_to_vcf(test_name: str, vcf_path: str, json_path: str):
     """
-    Create vCard from JSON data, serialize it, and compare to the original VCF.
+    Create vCard from JSON data and compare it to the parsed original VCF.
 
     Args:
         test_name: Name of the test case
         vcf_path: Path to the .vcf file
         json_path: Path to the .json file
     """
-    # Load JSON data
-    with open(json_path, 'r', encoding='utf-8') as f:
-        test_data = json.load(f)
+    # The builder output is compared as a DOM; serialization is covered
+    # by test_serialize_roundtrip below.
+    actual_vcards = load_vcards_from_json(json_path)
+
+    parser = VCardParser()
+    expected_vcards = parser.parse(read_vcf_file(vcf_path))
+
+    assert_vcards_match(test_name, expected_vcards, actual_vcards)
+
 
-    # Create vCard objects from JSON
-    vcards = []
-    for vcard_data in test_data['vcards']:
-        vcard = create_vcard_from_json(vcard_data)
-        vcards.append(vcard)
+@pytest.mark.parametrize("test_name,vcf_path,json_path", get_test_files())
+def test_serialize_roundtrip(test_name: str, vcf_path: str, json_path: str):
+    """Serialize the JSON-built vCards, parse them back and compare."""
+    vcards = load_vcards_from_json(json_path)
 
-    # Serialize to VCF format
     serializer = VCardSerializer()
     if len(vcards) == 1:
-        actual_vcf_text = serializer.serialize(vcards[0])
+        vcf_text = serializer.serialize(vcards[0])
     else:
-        actual_vcf_text = serializer.serialize_multiple(vcards)
+        vcf_text = serializer.serialize_multiple(vcards)
 
-    # Parse both expected and actual for semantic comparison
     parser = VCardParser()
-    with open(vcf_path, 'r', encoding='utf-8') as f:
-        expected_vcf_text = f.read()
+    assert_vcards_match(test_name, vcards, parser.parse(vcf_text))
 
-    expected_vcards = parser.parse(expected_vcf_text)
-    actual_vcards = parser.parse(actual_vcf_text)
 
-    # Compare counts
-    assert len(actual_vcards) == len(expected_vcards), \
-        f"{test_name}: Expected {len(expected_vcards)} vCards, got {len(actual_vcards)}"
+def dom_snapshot(vcards: List[VCardObject]) -> List[List[tuple]]:
+    """Reduce parsed vCards to comparable (name, value, parameters) tuples."""
+    return [
+        [(prop.name, prop.value, prop.parameters) for prop in vcard.properties]
+        for vcard in vcards
+    ]
 
-    # Compare key properties
-    for i, (expected_vcard, actual_vcard) in enumerate(zip(expected_vcards, actual_vcards)):
-        assert_property(test_name, f"vCard[{i}].VERSION", expected_vcard.version, actual_vcard.version)
-        assert_property(test_name, f"vCard[{i}].FN", expected_vcard.formatted_name, actual_vcard.formatted_name)
 
-        # For semantic comparison, check that key properties match
-        if expected_vcard.name:
-            assert_property(test_name, f"vCard[{i}].N", expected_vcard.name, actual_vcard.name)
+@pytest.mark.parametrize("test_name,vcf_path,json_path", get_test_files())
+def test_parse_file_matches_parse(test_name: str, vcf_path: str, json_path: str):
+    """parse_file streams the file itself, so check it agrees with parse."""
+    parser = VCardParser()
+    expected_vcards = parser.parse(read_vcf_file(vcf_path))
+    actual_vcards = parser.parse_file(vcf_path)
+
+    assert dom_snapshot(actual_vcards) == dom_snapshot(expected_vcards), \
+        f"{test_name}: parse_file and parse disagree"
+
+
+@pytest.mark.parametrize("separator", ["\x0c", "\u2028"])
+def test_parse_file_keeps_line_break_characters_in_values(tmp_path, separator: str):
+    """Form feed and U+2028 are value characters, not line breaks, in both parse paths."""
+    vcf_text = (
+        "BEGIN:VCARD\r\n"
+        "VERSION:4.0\r\n"
+        "FN:John Doe\r\n"
+        f"NOTE:first{separator}second\r\n"
+        "END:VCARD\r\n"
+    )
+    vcf_path = tmp_path / "line_break.vcf"
+    vcf_path.write_bytes(vcf_text.encode('utf-8'))
+
+    parser = VCardParser()
+    expected_vcards = parser.parse(vcf_text)
+    actual_vcards = parser.parse_file(str(vcf_path))
+
+    assert expected_vcards[0].get_property("NOTE").value == f"first{separator}second"
+    assert dom_snapshot(actual_vcards) == dom_snapshot(expected_vcards)
@@ -0,0 +1,140 @@
+"""
+Tests for the vCard validator
+"""
+
+from vcard.builder import VCardBuilder
+from vcard.dom import VCardObject, VCardProperty
+from vcard.validator import VCardValidator, ValidationResult
+
+
+def make_valid_vcard() -> VCardObject:
+    """A vCard with no errors or warnings."""
+    return VCardBuilder().with_version("4.0").with_formatted_name("John Doe").build()
+
+
+def make_invalid_vcard() -> VCardObject:
+    """A vCard with one error (missing FN) and one warning (VERSION 3.0)."""
+    return VCardBuilder().with_version("3.0").build()
+
+
+def test_default_mode_stores_messages():
+    """Test that without callbacks messages are collected in the lists"""
+    result = VCardValidator().validate(make_invalid_vcard())
+
+    assert not result.is_valid
+    assert result.errors == ["Required property FN is missing"]
+    assert result.warnings == ["VERSION 3.0 is supported but deprecated. Consider upgrading to 4.0"]
+    summary = result.get_summary()
+    assert "Errors: 1\n" in summary
+    assert "Warnings: 1\n" in summary
+    assert "  - Required property FN is missing\n" in summary
+
+
+def test_default_mode_valid_vcard():
+    """Test that a valid vCard yields an empty, valid result"""
+    result = VCardValidator().validate(make_valid_vcard())
+
+    assert result.is_valid
+    assert result.errors == []
+    assert result.warnings == []
+
+
+def test_is_valid_follows_errors_list_in_default_mode():
+    """Test that is_valid reflects direct changes to the errors list"""
+    result = VCardValidator().validate(make_invalid_vcard())
+    result.errors.clear()
+    assert result.is_valid
+
+    result.errors.append("Custom error")
+    assert not result.is_valid
+
+
+def test_callbacks_receive_messages_instead_of_lists():
+    """Test that callbacks get every message and the lists stay empty"""
+    errors = []
+    warnings = []
+    result = ValidationResult(on_error=errors.append, on_warning=warnings.append)
+
+    returned = VCardValidator().validate(make_invalid_vcard(), result)
+
+    assert returned is result
+    assert errors == ["Required property FN is missing"]
+    assert warnings == ["VERSION 3.0 is supported but deprecated. Consider upgrading to 4.0"]
+    assert result.errors == []
+    assert result.warnings == []
+
+
+def test_streaming_mode_is_valid_and_summary_counts():
+    """Test that is_valid and the summary counts include streamed messages"""
+    result = ValidationResult(on_error=lambda error: None, on_warning=lambda warning: None)
+    VCardValidator().validate(make_invalid_vcard(), result)
+
+    assert not result.is_valid
+    summary = result.get_summary()
+    assert "Validation Result: INVALID\n" in summary
+    assert "Errors: 1\n" in summary
+    assert "Warnings: 1\n" in summary
+
+
+def test_streaming_mode_valid_vcard():
+    """Test that a streaming result stays valid when nothing is reported"""
+    result = ValidationResult(on_error=lambda error: None)
+    VCardValidator().validate(make_valid_vcard(), result)
+
+    assert result.is_valid
+    assert "Errors: 0\n" in result.get_summary()
+
+
+def test_shared_result_accumulates_across_vcards():
+    """Test that one result passed to validate collects messages from several vCards"""
+    errors = []
+    result = ValidationResult(on_error=errors.append)
+    validator = VCardValidator()
+
+    for vcard in [make_valid_vcard(), make_invalid_vcard(), make_invalid_vcard()]:
+        validator.validate(vcard, result)
+
+    assert errors == ["Required property FN is missing"] * 2
+    assert len(result.warnings) == 2
+    assert not result.is_valid
+    summary = result.get_summary()
+    assert "Errors: 2\n" in summary
+    assert "Warnings: 2\n" in summary
+
+
+def test_non_standard_tel_type_warning_uses_lowercase_value():
+    """Test that TEL TYPE values are checked, and reported, in their stored lowercase form"""
+    vcard = make_valid_vcard()
+    vcard.add_property(VCardProperty("TEL", "1"))
+    vcard.get_property("TEL").add_parameter("TYPE", "WORK")
+    vcard.get_property("TEL").add_parameter("TYPE", "Bogus")
+
+    result = VCardValidator().validate(vcard)
+
+    assert result.warnings == ["TEL TYPE parameter has non-standard value: bogus"]
+
+
+def test_tel_type_written_into_parameters_dict_is_case_insensitive():
+    """Test that TYPE values put straight into the parameters dict are matched case-insensitively"""
+    vcard = make_valid_vcard()
+    tel = VCardProperty("TEL", "1")
+    tel.parameters["TYPE"] = ["WORK", "Bogus"]
+    vcard.add_property(tel)
+
+    result = VCardValidator().validate(vcard)
+
+    assert tel.get_parameters("TYPE") == ["WORK", "Bogus"]
+    assert result.warnings == ["TEL TYPE parameter has non-standard value: Bogus"]
+
+
+def test_tel_type_assigned_through_parameters_setter_is_lowercased():
+    """Test that the parameters setter stores TYPE values lowercase"""
+    vcard = make_valid_vcard()
+    tel = VCardProperty("TEL", "1")
+    tel.parameters = {"TYPE": ["WORK", "Voice"]}
+    vcard.add_property(tel)
+
+    result = VCardValidator().validate(vcard)
+
+    assert tel.get_parameters("TYPE") == ["work", "voice"]
+    assert result.warnings == []